@@ -1,10 +1,21 @@
 #!/usr/bin/env node
-const { spawnSync } = require("node:child_process");
-const { statSync, readdirSync } = require("node:fs");
+const { spawn } = require("node:child_process");
+const { statSync, readdirSync, readFileSync, writeFileSync, mkdirSync } = require("node:fs");
+const os = require("node:os");
 const path = require("node:path");
 
 const targets = ["public"]; // public/assets/tiles is already handled by public recursion
 const pngFiles = [];
+// Size + mtime of every file as oxipng last left it; delete this file to force a full pass.
+const manifestPath = path.join("node_modules", ".cache", "optimize-pngs.json");
+
+const loadManifest = () => {
+  try {
+    return JSON.parse(readFileSync(manifestPath, "utf8"));
+  } catch (err) {
+    return {};
+  }
+};
 
 const collectPngs = (dir) => {
   let entries;
@@ -29,19 +40,67 @@ const run = async () => {
 
   targets.forEach(collectPngs);
 
-  const optimize = (file) => {
-    const before = statSync(file).size;
-    const args = ["-o", "6", "--strip", "all", "--zopfli", "--skip-if-larger", "--quiet", file];
-    const result = spawnSync(oxipng, args, { stdio: "pipe" });
-    if (result.error) {
-      console.error(`Failed ${file}: ${result.error.message}`);
-      return { file, before, after: before, ok: false };
+  const previous = loadManifest();
+  const manifest = {};
+  const pending = pngFiles.filter((file) => {
+    const { size, mtimeMs } = statSync(file);
+    const seen = previous[file];
+    if (seen && seen.size === size && seen.mtimeMs === mtimeMs) {
+      manifest[file] = seen;
+      return false;
+    }
+    return true;
+  });
+
+  const optimize = (file) =>
+    new Promise((resolve) => {
+      const before = statSync(file).size;
+      const args = ["-o", "6", "-t", "1", "--strip", "all", "--zopfli", "--skip-if-larger", "--quiet", file];
+      const child = spawn(oxipng, args, { stdio: ["ignore", "ignore", "pipe"] });
+      let stderr = "";
+      child.stderr.on("data", (chunk) => {
+        stderr += chunk;
+      });
+      // A failed spawn emits "error" and then "close"; only the first settles the job.
+      let settled = false;
+      const fail = (reason) => {
+        if (settled) return;
+        settled = true;
+        console.error(`Failed ${file}: ${reason}${stderr ? `\n${stderr.trim()}` : ""}`);
+        resolve({ file, before, after: before, ok: false });
+      };
+      child.on("error", (err) => fail(err.message));
+      child.on("close", (code) => {
+        if (code !== 0) {
+          fail(`oxipng exited with code ${code}`);
+          return;
+        }
+        if (settled) return;
+        settled = true;
+        const { size: after, mtimeMs } = statSync(file);
+        manifest[file] = { size: after, mtimeMs };
+        resolve({ file, before, after, ok: true });
+      });
+    });
+
+  // Parallelise across files rather than inside oxipng: each process runs its
+  // trials on a single thread (-t 1), and one process per core stays busy.
+  const cores = typeof os.availableParallelism === "function" ? os.availableParallelism() : os.cpus().length;
+  const concurrency = Math.max(1, Math.min(cores, pending.length));
+  const results = [];
+  let next = 0;
+  const worker = async () => {
+    while (next < pending.length) {
+      const file = pending[next];
+      next += 1;
+      results.push(await optimize(file));
     }
-    const after = statSync(file).size;
-    return { file, before, after, ok: true };
   };
+  await Promise.all(Array.from({ length: concurrency }, worker));
+
+  mkdirSync(path.dirname(manifestPath), { recursive: true });
+  writeFileSync(manifestPath, JSON.stringify(manifest));
 
-  const results = pngFiles.map(optimize);
   const succeeded = results.filter((r) => r.ok);
   const totalBefore = succeeded.reduce((sum, r) => sum + r.before, 0);
   const totalAfter = succeeded.reduce((sum, r) => sum + r.after, 0);
@@ -51,7 +110,7 @@ const run = async () => {
     `Optimized ${succeeded.length} PNGs. Saved ${(saved / 1024).toFixed(1)} KiB (${(
       (saved / Math.max(totalBefore, 1)) *
       100
-    ).toFixed(2)}%).`,
+    ).toFixed(2)}%). Skipped ${pngFiles.length - pending.length} unchanged.`,
   );
 };
 
@@ -40,29 +40,30 @@ export const getHexCenter = (col: number, row: number, geom: HexGeometry, offset
   };
 };
 
-export const getHexCorners = (center: Vec2, geom: HexGeometry): Vec2[] => {
-  const corners: Vec2[] = [];
-  for (let i = 0; i < 6; i += 1) {
-    const angle = ((60 * i - 30) * Math.PI) / 180;
-    corners.push({
-      x: center.x + geom.size * Math.cos(angle),
-      y: center.y + geom.size * Math.sin(angle),
-    });
-  }
-  return corners;
-};
+// Unit-radius corner offsets for a pointy-top hex, computed once instead of
+// six cos/sin pairs per cell per frame.
+const HEX_CORNER_OFFSETS: readonly Vec2[] = Array.from({ length: 6 }, (_, i) => {
+  const angle = ((60 * i - 30) * Math.PI) / 180;
+  return { x: Math.cos(angle), y: Math.sin(angle) };
+});
+
+export const getHexCorners = (center: Vec2, geom: HexGeometry): Vec2[] =>
+  HEX_CORNER_OFFSETS.map((offset) => ({
+    x: center.x + geom.size * offset.x,
+    y: center.y + geom.size * offset.y,
+  }));
 
 export const traceHexPath = (ctx: CanvasRenderingContext2D, center: Vec2, geom: HexGeometry) => {
-  const corners = getHexCorners(center, geom);
-  if (!corners.length || !corners[0]) return;
   ctx.beginPath();
-  ctx.moveTo(corners[0].x, corners[0].y);
-  for (let i = 1; i < corners.length; i += 1) {
-    const corner = corners[i];
-    if (corner) {
-      ctx.lineTo(corner.x, corner.y);
+  HEX_CORNER_OFFSETS.forEach((offset, i) => {
+    const x = center.x + geom.size * offset.x;
+    const y = center.y + geom.size * offset.y;
+    if (i === 0) {
+      ctx.moveTo(x, y);
+    } else {
+      ctx.lineTo(x, y);
     }
-  }
+  });
   ctx.closePath();
 };
 